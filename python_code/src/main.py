@@ -1,11 +1,44 @@
 from solvers import Euler1D_Solve
 import numpy as np
+import sympy
 import configparser
 
 
-# Define f(t, y) dynamically using eval
-def f(t, y):
-    return eval(expr, {"np": np, "t": t, "y": y})
+def build_rhs(expr: str):
+    """
+    Build f(t, y) from the expression string in config.ini.
+
+    The expression is parsed once. Plain math expressions (e.g. cos(t) - y)
+    are lambdified into a NumPy function; expressions written with the
+    numpy convention (e.g. np.cos(t) - y) are compiled once and evaluated
+    with a fixed globals dict. Sympy constants other than pi (E, I, oo,
+    ...) are not picked up, those names behave as in plain eval.
+
+    Args:
+        expr (str): Right hand side of dy/dt = f(t, y)
+
+    Returns:
+        Callable: Function f(t, y), accepting scalars or arrays
+    """
+    t_s, y_s = sympy.symbols("t y")
+    try:
+        rhs = sympy.sympify(expr, locals={"t": t_s, "y": y_s})
+        # only t, y, real numbers and pi, no other sympy constants
+        if all(
+            a in (t_s, y_s, sympy.pi) or a.is_Rational or a.is_Float
+            for a in rhs.atoms()
+        ):
+            return sympy.lambdify((t_s, y_s), rhs, modules="numpy")
+    except (sympy.SympifyError, AttributeError, TypeError):
+        pass
+
+    code = compile(expr, "<ode>", "eval")
+    g = {"np": np}
+
+    def f(t, y):
+        return eval(code, g, {"t": t, "y": y})
+
+    return f
 
 
 if __name__ == "__main__":
@@ -20,6 +53,7 @@ if __name__ == "__main__":
     y_0 = config.getfloat("initial_conditions", "y_0")
     # Derivative function
     expr = config.get("ode_function", "expression")
+    f = build_rhs(expr)
 
     # Create an instance of the solver
     solver = Euler1D_Solve(f, domain_start, domain_end, y_0, n)
@@ -1,7 +1,166 @@
+import math
 import numpy as np
+from functools import cached_property
 from typing import Callable
 import matplotlib.pyplot as plt
-import pandas as pd
+
+try:
+    from numba import get_num_threads, njit, prange
+    from numba.core.errors import TypingError
+    from numba.extending import is_jitted
+except ImportError:  # numba is optional, solve() falls back to NumPy/Python
+    njit = None
+
+
+if njit is not None:
+
+    @njit
+    def _euler_loop(f, t0, h, y0, n):
+        """Compiled Euler loop, f must itself be an @njit function."""
+        y = np.empty(n + 1)
+        y[0] = y0
+        for k in range(n):
+            y[k + 1] = y[k] + h * f(t0 + k * h, y[k])
+        return y
+
+    @njit(parallel=True)
+    def _euler_batch_loop(f, t0, h, y0, n, tile):
+        """Compiled batch Euler loop, each tile runs on its own core."""
+        m = y0.shape[0]
+        Y = np.empty((n + 1, m))
+        for i in prange((m + tile - 1) // tile):
+            lo = i * tile
+            hi = min(lo + tile, m)
+            Y[0, lo:hi] = y0[lo:hi]
+            for k in range(n):
+                t = t0 + k * h
+                for j in range(lo, hi):
+                    Y[k + 1, j] = Y[k, j] + h * f(t, Y[k, j])
+        return Y
+
+    @njit
+    def _rk4_loop(f, t0, h, y0, n):
+        """Compiled RK4 loop, f must itself be an @njit function."""
+        y = np.empty(n + 1)
+        y[0] = y0
+        for k in range(n):
+            t = t0 + k * h
+            k1 = f(t, y[k])
+            k2 = f(t + h / 2, y[k] + h / 2 * k1)
+            k3 = f(t + h / 2, y[k] + h / 2 * k2)
+            k4 = f(t + h, y[k] + h * k3)
+            y[k + 1] = y[k] + h * (k1 + 2 * k2 + 2 * k3 + k4) / 6
+        return y
+
+    @njit(parallel=True)
+    def _rk4_batch_loop(f, t0, h, y0, n, tile):
+        """Compiled batch RK4 loop, each tile runs on its own core."""
+        m = y0.shape[0]
+        Y = np.empty((n + 1, m))
+        for i in prange((m + tile - 1) // tile):
+            lo = i * tile
+            hi = min(lo + tile, m)
+            Y[0, lo:hi] = y0[lo:hi]
+            for k in range(n):
+                t = t0 + k * h
+                for j in range(lo, hi):
+                    k1 = f(t, Y[k, j])
+                    k2 = f(t + h / 2, Y[k, j] + h / 2 * k1)
+                    k3 = f(t + h / 2, Y[k, j] + h / 2 * k2)
+                    k4 = f(t + h, Y[k, j] + h * k3)
+                    Y[k + 1, j] = Y[k, j] + h * (k1 + 2 * k2 + 2 * k3 + k4) / 6
+        return Y
+
+
+# trajectories per batch tile of the numba kernels, keeps the two working
+# rows (y, f(t, y)) of a tile within half of a 32 KiB L1 data cache
+_BATCH_TILE = 32 * 1024 // 16
+
+# steps per block of the affine closed form in Euler1D_Solve._solve_affine
+_AFFINE_BLOCK = 1 << 16
+
+
+def _batch_tile(m: int) -> int:
+    """
+    Tile size for a numba batch of m trajectories.
+
+    Tiles are capped at _BATCH_TILE but kept small enough that there is at
+    least one tile per numba thread, so small batches still use all cores.
+
+    Args:
+        m (int): Number of trajectories in the batch
+
+    Returns:
+        int: Trajectories per tile
+    """
+    return max(1, min(_BATCH_TILE, -(-m // get_num_threads())))
+
+
+# upper bound on points drawn by plot_solution, and largest num_steps for
+# which it still draws a marker per point
+_PLOT_MAX_POINTS = 10_000
+_PLOT_MARKER_MAX_STEPS = 500
+
+# scalar types accepted for t_start, t_end and y_0 (bool is rejected apart)
+_NUMERIC = (int, float, np.integer, np.floating)
+
+
+def _as_float(x, name: str) -> float:
+    """
+    Validate a real finite scalar input and convert it to float.
+
+    Args:
+        x: Value to validate
+        name (str): Argument name used in the error message
+
+    Returns:
+        float: x as a python float
+    """
+    msg = f"{name} must be a real finite number."
+    if isinstance(x, bool) or not isinstance(x, _NUMERIC):
+        raise TypeError(msg)
+    # check after conversion, huge ints overflow and longdoubles become inf
+    try:
+        with np.errstate(over="ignore"):
+            value = float(x)
+    except OverflowError:
+        raise TypeError(msg) from None
+    if not math.isfinite(value):
+        raise TypeError(msg)
+    return value
+
+
+def _affine_recurrence(M: np.ndarray, C: np.ndarray, y0: float) -> np.ndarray:
+    """
+    Evaluate y[k+1] = M[k] * y[k] + C[k] with cumprod/cumsum.
+
+    The running product P restarts at 1 for every call. If it under- or
+    overflows, the range is halved and the halves are chained through
+    their boundary value.
+
+    Args:
+        M (np.ndarray): Multipliers M[k]
+        C (np.ndarray): Offsets C[k]
+        y0 (float): Value before the first step
+
+    Returns:
+        np.ndarray: y[1], ..., y[len(M)], non-finite if y itself blows up
+    """
+    with np.errstate(all="ignore"):
+        if M.size == 1:
+            return M * y0 + C
+        P = np.cumprod(M)
+        y = P * (y0 + np.cumsum(C / P))
+    if np.all(np.isfinite(y)):
+        return y
+
+    mid = M.size // 2
+    left = _affine_recurrence(M[:mid], C[:mid], y0)
+    if not np.isfinite(left[-1]):
+        return np.full(M.size, np.nan)
+    return np.concatenate(
+        (left, _affine_recurrence(M[mid:], C[mid:], left[-1]))
+    )
 
 
 class Euler1D_Solve:
@@ -14,14 +173,17 @@ class Euler1D_Solve:
         t_end (float): End of time domain
         y_0 (float): Initial value of y
         num_steps (int): Number of steps to take (mesh will have num_steps + 1 points)
-        mesh (np.ndarray): Array of mesh points (t values)
-        h (float): Step size
-        solution (np.ndarray): Array of y values at each mesh point
+        mesh (np.ndarray): Array of mesh points (t values), lazy
+        h (float): Step size, lazy
+        solution (np.ndarray): Array of y values at each mesh point, lazy
 
     Methods:
         create_1d_mesh(): Create 1D mesh.
+        mesh_at(k): Mesh point(s) at index k without building the mesh.
         calc_step_size(): Calculate step size h.
-        solve(): Solve the IVP using Euler's method.
+        solve(): Solve the IVP with the class's stepping scheme.
+        solve_batch(y0_vec): Solve the IVP for many initial values at once.
+        as_ivp(): Keyword arguments for scipy.integrate.solve_ivp.
         plot_solution(): Plot the numerical solution with h and n in the legend.
         csv_export(filename: str): Export the solution to a CSV file.
 
@@ -37,8 +199,22 @@ class Euler1D_Solve:
         solver = Euler1D_Solve(f, t_start, t_end, y_0, num_steps)
         solver.plot_solution()
         solver.csv_export("solution.csv")
+
+    Note:
+        If numba is installed, decorate f with @numba.njit to run the
+        whole integration as compiled code.
     """
 
+    method_name = "Euler"
+
+    # numba kernels used by _solve_jit and _solve_batch_jit, subclasses
+    # swap in their own stepping scheme
+    _jit_loop = None
+    _jit_batch_loop = None
+    if njit is not None:
+        _jit_loop = staticmethod(_euler_loop)
+        _jit_batch_loop = staticmethod(_euler_batch_loop)
+
     def __init__(
         self,
         f: Callable[[float, float], float],
@@ -63,29 +239,38 @@ class Euler1D_Solve:
         self.f = f
 
         # Validate t_start and t_end
-        if not isinstance(t_start, (int, float)) or not isinstance(
-            t_end, (int, float)
-        ):
-            raise TypeError("t_start and t_end must be numbers.")
-        if t_start >= t_end:
+        self.t_start = _as_float(t_start, "t_start")
+        self.t_end = _as_float(t_end, "t_end")
+        if self.t_start >= self.t_end:
             raise ValueError("t_start must be less than t_end.")
-        self.t_start = float(t_start)
-        self.t_end = float(t_end)
 
         # Validate num_steps
-        if not isinstance(num_steps, int) or num_steps <= 0:
+        if (
+            isinstance(num_steps, bool)
+            or not isinstance(num_steps, int)
+            or num_steps <= 0
+        ):
             raise ValueError("num_steps must be a pos integer.")
         self.num_steps = num_steps
 
         # Validate y_0
-        if not isinstance(y_0, (int, float)) or isinstance(y_0, bool):
-            raise TypeError("y_0 must be a real number.")
-        self.y_0 = float(y_0)
+        self.y_0 = _as_float(y_0, "y_0")
 
-        # calculated attributes when the class is initialized
-        self.mesh = self.create_1d_mesh()
-        self.h = self.calc_step_size()
-        self.solution = self.solve()
+    # calculated attributes, computed on first access and then cached
+    @cached_property
+    def mesh(self) -> np.ndarray:
+        """np.ndarray: Array of mesh points (t values)"""
+        return self.create_1d_mesh()
+
+    @cached_property
+    def h(self) -> float:
+        """float: Step size"""
+        return self.calc_step_size()
+
+    @cached_property
+    def solution(self) -> np.ndarray:
+        """np.ndarray: Array of y values at each mesh point"""
+        return self.solve()
 
     def create_1d_mesh(self) -> np.ndarray:
         """
@@ -96,6 +281,24 @@ class Euler1D_Solve:
         """
         return np.linspace(self.t_start, self.t_end, self.num_steps + 1)
 
+    def mesh_at(self, k):
+        """
+        Mesh point(s) t_k without building the full mesh.
+
+        Matches create_1d_mesh() exactly, including the t_end endpoint.
+
+        Args:
+            k (int | np.ndarray): Mesh index or array of mesh indices
+
+        Returns:
+            float | np.ndarray: t value(s) at index k
+        """
+        k = np.asarray(k)
+        t = np.where(
+            k == self.num_steps, self.t_end, self.t_start + k * self.h
+        )
+        return t[()]
+
     def calc_step_size(self) -> float:
         """
         Calculate step size h.
@@ -107,7 +310,44 @@ class Euler1D_Solve:
 
     def solve(self) -> np.ndarray:
         """
-        Solve the IVP using Euler's method.
+        Solve the IVP with the class's stepping scheme (method_name).
+
+        An @njit compiled f runs through the compiled loop. Otherwise, for
+        schemes with an affine closed form (see _solve_affine), RHS
+        functions that are affine in y and accept array inputs are solved
+        in a vectorized pass; everything else falls back to the
+        step-by-step loop.
+
+        Returns:
+            np.ndarray: Array of y values at each mesh point
+        """
+        y = self._solve_jit()
+        if y is None:
+            y = self._solve_affine()
+        if y is None:
+            y = self._solve_loop()
+        return y
+
+    def _solve_jit(self) -> np.ndarray | None:
+        """
+        Solve the IVP with the numba compiled loop.
+
+        Returns:
+            np.ndarray | None: Array of y values at each mesh point, or
+            None if numba is missing or f is not an @njit function
+        """
+        if self._jit_loop is None or not is_jitted(self.f):
+            return None
+        try:
+            return self._jit_loop(
+                self.f, self.t_start, self.h, self.y_0, self.num_steps
+            )
+        except TypingError:
+            return None
+
+    def _solve_loop(self) -> np.ndarray:
+        """
+        Solve the IVP one Euler step at a time.
 
         Returns:
             np.ndarray: Array of y values at each mesh point
@@ -115,42 +355,325 @@ class Euler1D_Solve:
         y = np.zeros(self.num_steps + 1)
         y[0] = self.y_0
 
+        # plain python locals on the hot path, t is rebuilt as t0 + k * h
+        f, t0, h, yk = self.f, self.t_start, self.h, self.y_0
         for k in range(self.num_steps):
-            t = self.mesh[k]
-            y[k + 1] = y[k] + self.h * self.f(t, y[k])
+            yk = yk + h * f(t0 + k * h, yk)
+            y[k + 1] = yk
+
+        return y
+
+    def _eval_rhs(self, t: np.ndarray, y) -> np.ndarray | None:
+        """
+        Evaluate f on a whole array of t values at once.
+
+        Args:
+            t (np.ndarray): Array of t values
+            y: Scalar or array of y values, broadcastable against t
+
+        Returns:
+            np.ndarray | None: f(t, y) with the shape of t, or None if f
+            does not support array inputs
+        """
+        try:
+            with np.errstate(all="ignore"):
+                out = np.asarray(self.f(t, y), dtype=float)
+            return np.broadcast_to(out, t.shape)
+        except Exception:
+            return None
+
+    def _solve_affine(self) -> np.ndarray | None:
+        """
+        Solve the IVP in closed form when f(t, y) = a(t) * y + b(t).
+
+        The Euler recurrence y[k+1] = M[k] * y[k] + C[k], with
+        M = 1 + h * a and C = h * b, is evaluated with cumprod/cumsum in
+        blocks of _AFFINE_BLOCK steps, carrying y across block boundaries.
+        This keeps temporaries at block size, and blocks whose running
+        product under/overflows are split further. Each block is checked against the
+        recurrence before it is accepted, so non-affine or
+        non-vectorizable f return None, usually after the first block.
 
+        Returns:
+            np.ndarray | None: Array of y values at each mesh point, or
+            None if the vectorized path does not apply
+        """
+        y = np.empty(self.num_steps + 1)
+        y[0] = self.y_0
+        for lo in range(0, self.num_steps, _AFFINE_BLOCK):
+            hi = min(lo + _AFFINE_BLOCK, self.num_steps)
+            if not self._solve_affine_block(y, lo, hi):
+                return None
         return y
 
+    def _solve_affine_block(self, y: np.ndarray, lo: int, hi: int) -> bool:
+        """
+        Fill y[lo + 1 : hi + 1] from y[lo] with the affine closed form.
+
+        Args:
+            y (np.ndarray): Solution array, y[lo] already set
+            lo (int): First step of the block
+            hi (int): One past the last step of the block
+
+        Returns:
+            bool: False if f is not affine in y on this block or the
+            result does not satisfy the Euler recurrence
+        """
+        t = self.t_start + np.arange(lo, hi) * self.h
+        f0 = self._eval_rhs(t, 0.0)
+        f1 = self._eval_rhs(t, 1.0) if f0 is not None else None
+        f2 = self._eval_rhs(t, 2.0) if f1 is not None else None
+        if f2 is None:
+            return False
+
+        # affine in y means a zero second difference, up to rounding only
+        eps = np.finfo(float).eps
+        d2 = np.abs(f2 - 2.0 * f1 + f0)
+        if np.any(d2 > 8 * eps * (np.abs(f0) + 2 * np.abs(f1) + np.abs(f2))):
+            return False
+
+        # y[lo] carries the state over from the previous block
+        y_blk = _affine_recurrence(
+            1.0 + self.h * (f1 - f0), self.h * f0, y[lo]
+        )
+        if not np.all(np.isfinite(y_blk)):
+            return False
+        y[lo + 1 : hi + 1] = y_blk
+
+        # accept only if each increment (y[k+1] - y[k]) / h equals f(t, y[k]),
+        # atol is the rounding floor of differencing y
+        fy = self._eval_rhs(t, y[lo:hi])
+        if fy is None:
+            return False
+        atol = 64 * eps * float(np.max(np.abs(y[lo : hi + 1]))) / self.h
+        return np.allclose(
+            np.diff(y[lo : hi + 1]) / self.h, fy, rtol=1e-12, atol=atol
+        )
+
+    def solve_batch(self, y0_vec: np.ndarray) -> np.ndarray:
+        """
+        Solve the IVP for a batch of initial values in lockstep.
+
+        f must broadcast over y, i.e. f(t, y) with a 1D array y returns an
+        array of the same shape. An @njit compiled f is called per
+        trajectory instead and runs in parallel over cache sized tiles of
+        the batch.
+
+        Args:
+            y0_vec (np.ndarray): 1D array of initial values of y
+
+        Returns:
+            np.ndarray: Array of shape (num_steps + 1, n_batch), column j
+            is the solution for y0_vec[j]
+        """
+        y0_vec = np.asarray(y0_vec, dtype=float)
+        if (
+            y0_vec.ndim != 1
+            or y0_vec.size == 0
+            or not np.all(np.isfinite(y0_vec))
+        ):
+            raise ValueError("y0_vec must be a non-empty 1D finite array.")
+
+        Y = self._solve_batch_jit(y0_vec)
+        if Y is not None:
+            return Y
+
+        Y = np.empty((self.num_steps + 1, y0_vec.size))
+        Y[0] = y0_vec
+        self._solve_batch_loop(Y)
+
+        return Y
+
+    def _solve_batch_jit(self, y0_vec: np.ndarray) -> np.ndarray | None:
+        """
+        Solve the batch IVP with the parallel numba compiled loop.
+
+        Args:
+            y0_vec (np.ndarray): 1D array of initial values of y
+
+        Returns:
+            np.ndarray | None: Array of shape (num_steps + 1, n_batch), or
+            None if numba is missing or f is not an @njit function
+        """
+        if self._jit_batch_loop is None or not is_jitted(self.f):
+            return None
+        try:
+            return self._jit_batch_loop(
+                self.f,
+                self.t_start,
+                self.h,
+                y0_vec,
+                self.num_steps,
+                _batch_tile(y0_vec.size),
+            )
+        except TypingError:
+            return None
+
+    def _solve_batch_loop(self, Y: np.ndarray):
+        """
+        Run the batch Euler loop on all trajectories at once, in place.
+
+        Args:
+            Y (np.ndarray): Array of shape (num_steps + 1, n_batch) with
+                the initial values in row 0
+        """
+        f, t0, h, Yk = self.f, self.t_start, self.h, Y[0]
+        for k in range(self.num_steps):
+            Yk = Yk + h * f(t0 + k * h, Yk)
+            Y[k + 1] = Yk
+
+    def as_ivp(self) -> dict:
+        """
+        Express the problem in the scipy.integrate.solve_ivp signature.
+
+        Lets the same f be solved with a higher order method, e.g.
+        solve_ivp(**solver.as_ivp(), method="DOP853").
+
+        Returns:
+            dict: Keyword arguments fun, t_span, y0 and t_eval
+        """
+        f = self.f
+
+        def fun(t, y):
+            return np.array([f(t, y[0])])
+
+        return {
+            "fun": fun,
+            "t_span": (self.t_start, self.t_end),
+            "y0": [self.y_0],
+            "t_eval": self.mesh,
+        }
+
     def plot_solution(self):
         """
         Plot the numerical solution with h and n in the legend.
+
+        Long runs are decimated to _PLOT_MAX_POINTS evenly spaced points
+        (first and last included). Markers are only drawn up to
+        _PLOT_MARKER_MAX_STEPS steps and the line is rasterized, so saved
+        vector figures do not embed the full polyline.
         """
-        if self.solution is None:
-            raise ValueError("You must call .solve() before plotting.")
+        # no more points than the screen can resolve
+        n_points = min(self.num_steps + 1, _PLOT_MAX_POINTS)
+        idx = np.linspace(0, self.num_steps, n_points).astype(int)
+        use_markers = self.num_steps <= _PLOT_MARKER_MAX_STEPS
 
         plt.figure(figsize=(8, 5))
         plt.plot(
-            self.mesh,
-            self.solution,
-            label=f"Euler method (h = {self.h:.4f}, n = {self.num_steps})",
-            marker="o",
+            self.mesh_at(idx),
+            self.solution[idx],
+            label=f"{self.method_name} method "
+            f"(h = {self.h:.4f}, n = {self.num_steps})",
+            marker="o" if use_markers else None,
+            rasterized=True,
         )
         plt.xlabel("t")
         plt.ylabel("y(t)")
-        plt.title("Euler Method Solution")
+        plt.title(f"{self.method_name} Method Solution")
         plt.legend()
         plt.grid(True)
         plt.tight_layout()
         plt.show()
 
-    def csv_export(self, filename: str):
+    def csv_export(self, filename: str, chunk_size: int = 100_000):
         """
         Export the solution to a CSV file.
 
+        Rows are written in chunks and t is generated per chunk, so the
+        full mesh is never built and the temporary (t, y) block never holds
+        more than chunk_size rows.
+
         Args:
             filename (str): Name of the output CSV file with path
+            chunk_size (int): Number of rows written per chunk
         """
-        data = {"t": self.mesh, "y(t)": self.solution}
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        if (
+            isinstance(chunk_size, bool)
+            or not isinstance(chunk_size, int)
+            or chunk_size <= 0
+        ):
+            raise ValueError("chunk_size must be a pos integer.")
+
+        with open(filename, "wb", buffering=1 << 20) as fh:
+            fh.write(b"t,y(t)\n")
+            for i in range(0, self.num_steps + 1, chunk_size):
+                k = np.arange(i, min(i + chunk_size, self.num_steps + 1))
+                block = np.column_stack((self.mesh_at(k), self.solution[k]))
+                np.savetxt(fh, block, delimiter=",", fmt="%.17g")
         print(f"Solution exported to {filename}")
+
+
+class RK4_1D_Solve(Euler1D_Solve):
+    """_summary_
+    Class to solve 1D ODE initial value problems using the classical
+    4-stage Runge-Kutta method (RK4).
+
+    Same interface as Euler1D_Solve, with the Euler step swapped for the
+    RK4 step in every solve path. RK4 has no affine closed form, so an RHS
+    that is not @njit compiled is always stepped.
+
+    The global error is O(h^4) instead of O(h), so for a tolerance tol the
+    number of steps scales as tol^(-1/4) instead of tol^(-1), i.e. about
+    tol^(-3/4) times fewer steps than Euler for smooth problems.
+
+    Example:
+        solver = RK4_1D_Solve(f, t_start, t_end, y_0, num_steps)
+        solver.plot_solution()
+        solver.csv_export("solution.csv")
+    """
+
+    method_name = "RK4"
+
+    if njit is not None:
+        _jit_loop = staticmethod(_rk4_loop)
+        _jit_batch_loop = staticmethod(_rk4_batch_loop)
+
+    def _solve_affine(self) -> None:
+        """
+        The closed form in Euler1D_Solve is specific to the Euler
+        recurrence, RK4 always steps.
+
+        Returns:
+            None
+        """
+        return None
+
+    def _solve_loop(self) -> np.ndarray:
+        """
+        Solve the IVP one RK4 step at a time.
+
+        Returns:
+            np.ndarray: Array of y values at each mesh point
+        """
+        y = np.zeros(self.num_steps + 1)
+        y[0] = self.y_0
+
+        f, t0, h, yk = self.f, self.t_start, self.h, self.y_0
+        for k in range(self.num_steps):
+            t = t0 + k * h
+            k1 = f(t, yk)
+            k2 = f(t + h / 2, yk + h / 2 * k1)
+            k3 = f(t + h / 2, yk + h / 2 * k2)
+            k4 = f(t + h, yk + h * k3)
+            yk = yk + h * (k1 + 2 * k2 + 2 * k3 + k4) / 6
+            y[k + 1] = yk
+
+        return y
+
+    def _solve_batch_loop(self, Y: np.ndarray):
+        """
+        Run the batch RK4 loop on all trajectories at once, in place.
+
+        Args:
+            Y (np.ndarray): Array of shape (num_steps + 1, n_batch) with
+                the initial values in row 0
+        """
+        f, t0, h, Yk = self.f, self.t_start, self.h, Y[0]
+        for k in range(self.num_steps):
+            t = t0 + k * h
+            k1 = f(t, Yk)
+            k2 = f(t + h / 2, Yk + h / 2 * k1)
+            k3 = f(t + h / 2, Yk + h / 2 * k2)
+            k4 = f(t + h, Yk + h * k3)
+            Yk = Yk + h * (k1 + 2 * k2 + 2 * k3 + k4) / 6
+            Y[k + 1] = Yk
@@ -0,0 +1,53 @@
+"""Tested build_rhs from main.py, the config expression parser."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# main.py is run from inside src and imports solvers as a top level module
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from main import build_rhs  # noqa: E402
+
+
+def test_build_rhs_lambdify():
+    # plain math goes through sympy.lambdify
+    f = build_rhs("cos(t) - y")
+    assert f.__name__ == "_lambdifygenerated"
+    assert np.isclose(f(0.5, 2.0), np.cos(0.5) - 2.0)
+    # pi is the one sympy constant that is allowed
+    assert np.isclose(build_rhs("pi*y")(0.0, 2.0), 2 * np.pi)
+
+
+def test_build_rhs_compiled():
+    # numpy convention is compiled once and evaluated with eval
+    f = build_rhs("np.cos(t) - y")
+    assert f.__name__ == "f"
+    assert np.isclose(f(0.5, 2.0), np.cos(0.5) - 2.0)
+
+
+def test_build_rhs_array_inputs():
+    t = np.linspace(0.0, 1.0, 5)
+    y = np.linspace(1.0, 2.0, 5)
+    for expr in ("cos(t) - y", "np.cos(t) - y"):
+        out = build_rhs(expr)(t, y)
+        assert out.shape == t.shape
+        assert np.allclose(out, np.cos(t) - y)
+
+
+def test_build_rhs_not_sympifiable():
+    # sympify fails on numpy-only calls, the compiled fallback handles them
+    f = build_rhs("np.where(t > 0.5, -y, y)")
+    assert np.allclose(f(np.array([0.0, 1.0]), 2.0), [2.0, -2.0])
+
+    # invalid syntax is still reported
+    with pytest.raises(SyntaxError):
+        build_rhs("t +")
+
+
+def test_build_rhs_rejects_sympy_constants():
+    # E and I are not config names, they fail as in plain eval
+    for expr in ("E*y", "I*y"):
+        with pytest.raises(NameError):
+            build_rhs(expr)(0.5, 2.0)
@@ -1,12 +1,24 @@
-"""Tested only the logical methods of the Euler1D_Solve class.
+"""Tested only the logical methods of the Euler1D_Solve and RK4_1D_Solve
+classes.
 namely,
 - create_1d_mesh
+- mesh_at
 - calc_step_size
 - solve
+- solve_batch
+- csv_export
+- as_ivp
 """
 
 import pytest
-from src_py.src.solvers import Euler1D_Solve
+from src_py.src import solvers
+from src_py.src.solvers import (
+    Euler1D_Solve,
+    RK4_1D_Solve,
+    _AFFINE_BLOCK,
+    _BATCH_TILE,
+    _batch_tile,
+)
 import numpy as np
 
 
@@ -37,6 +49,14 @@ def test_create_1d_mesh(solver1):
     assert np.isclose(mesh[-1], expected_end)
 
 
+def test_mesh_at(solver1):
+    k = np.arange(solver1.num_steps + 1)
+    # same values as the full mesh, endpoint included
+    assert np.array_equal(solver1.mesh_at(k), solver1.create_1d_mesh())
+    assert solver1.mesh_at(solver1.num_steps) == solver1.t_end
+    assert np.isclose(solver1.mesh_at(3), solver1.t_start + 3 * solver1.h)
+
+
 def test_calc_step_size(solver1):
     h = solver1.calc_step_size()
     expected_h = (solver1.t_end - solver1.t_start) / solver1.num_steps
@@ -75,6 +95,217 @@ def test_solve_method(solver1):
     )
 
 
+def test_solve_affine_matches_loop(solver1):
+    # affine RHS is solved in closed form, must agree with plain stepping
+    assert np.allclose(solver1._solve_affine(), solver1._solve_loop())
+
+    # non-affine RHS falls back to the step-by-step loop
+    def nonlinear_f(t, y):
+        return y**3 - 3 * y**2 + 2 * y
+
+    test_solver = Euler1D_Solve(
+        nonlinear_f, t_start=0.0, t_end=1.0, y_0=0.5, num_steps=20
+    )
+    assert test_solver._solve_affine() is None
+    assert np.allclose(test_solver.solve(), test_solver._solve_loop())
+
+    # several blocks over a long horizon, no under/overflow fallback
+    test_solver = Euler1D_Solve(
+        f,
+        t_start=0.0,
+        t_end=2000.0,
+        y_0=1.0,
+        num_steps=2 * _AFFINE_BLOCK + 5,
+    )
+    y_affine = test_solver._solve_affine()
+    assert y_affine is not None
+    assert np.allclose(y_affine, test_solver._solve_loop())
+
+    # weakly nonlinear RHS must not be mistaken for an affine one
+    for eps in (1e-6, 1e-7, 1e-12):
+
+        def weak_f(t, y):
+            return -y * (1 + eps * y)
+
+        for n in (10_000, 1_000_000):
+            test_solver = Euler1D_Solve(
+                weak_f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=n
+            )
+            assert test_solver._solve_affine() is None
+
+
+def test_solve_jit_matches_loop():
+    numba = pytest.importorskip("numba")
+    jit_f = numba.njit(f)
+
+    test_solver = Euler1D_Solve(
+        jit_f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=50
+    )
+    assert np.allclose(test_solver._solve_jit(), test_solver._solve_loop())
+
+    # plain python f is not sent to the compiled loop
+    test_solver = Euler1D_Solve(
+        f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=50
+    )
+    assert test_solver._solve_jit() is None
+
+
+def test_solve_batch_jit_matches_loop():
+    numba = pytest.importorskip("numba")
+    jit_f = numba.njit(f)
+
+    # compiled batch loop agrees with the broadcasting numpy loop
+    test_solver = Euler1D_Solve(
+        jit_f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=50
+    )
+    y0_vec = np.linspace(-1.0, 1.0, 5)
+    batch_jit = test_solver.solve_batch(y0_vec)
+    test_solver.f = f
+    assert np.allclose(batch_jit, test_solver.solve_batch(y0_vec))
+
+    # batches larger than one tile are stitched back in order
+    test_solver.f = jit_f
+    y0_vec = np.linspace(-1.0, 1.0, _BATCH_TILE + 3)
+    Y = test_solver.solve_batch(y0_vec)
+    assert np.array_equal(Y[0], y0_vec)
+    assert np.allclose(Y[:, -1], test_solver.solve_batch(y0_vec[-1:])[:, 0])
+
+
+def test_batch_tile(monkeypatch):
+    # tiles shrink so every numba thread gets work, up to _BATCH_TILE
+    monkeypatch.setattr(
+        solvers, "get_num_threads", lambda: 8, raising=False
+    )
+    assert _batch_tile(100) == 13
+    assert _batch_tile(4096) == 512
+    assert _batch_tile(10**6) == _BATCH_TILE
+
+    monkeypatch.setattr(
+        solvers, "get_num_threads", lambda: 1, raising=False
+    )
+    assert _batch_tile(100) == 100
+    assert _batch_tile(1) == 1
+
+
+def test_solve_batch(solver1):
+    y0_vec = np.array([-1.0, 0.0, 1.0, 2.5])
+    Y = solver1.solve_batch(y0_vec)
+
+    assert Y.shape == (solver1.num_steps + 1, y0_vec.size)
+    # every column matches the single trajectory solve
+    for j, y_0 in enumerate(y0_vec):
+        single = Euler1D_Solve(
+            f, t_start=0.0, t_end=5.0, y_0=y_0, num_steps=10
+        )
+        assert np.allclose(Y[:, j], single.solve())
+
+    with pytest.raises(ValueError, match="y0_vec must be a non-empty 1D"):
+        solver1.solve_batch(np.ones((2, 2)))
+    with pytest.raises(ValueError, match="y0_vec must be a non-empty 1D"):
+        solver1.solve_batch(np.array([1.0, np.nan]))
+
+
+def test_csv_export(solver1, tmp_path):
+    # chunked writing gives the same file as writing in one go
+    whole = tmp_path / "whole.csv"
+    chunked = tmp_path / "chunked.csv"
+    solver1.csv_export(str(whole))
+    solver1.csv_export(str(chunked), chunk_size=3)
+    assert whole.read_text() == chunked.read_text()
+
+    for bad in (0, True, 2.5):
+        with pytest.raises(ValueError, match="chunk_size must be a pos"):
+            solver1.csv_export(str(chunked), chunk_size=bad)
+
+    lines = whole.read_text().splitlines()
+    assert lines[0] == "t,y(t)"
+    data = np.loadtxt(whole, delimiter=",", skiprows=1)
+    assert np.array_equal(data[:, 0], solver1.mesh)
+    assert np.array_equal(data[:, 1], solver1.solution)
+
+
+def test_lazy_attributes():
+    calls = []
+
+    def counting_f(t, y):
+        calls.append(t)
+        return -y
+
+    test_solver = Euler1D_Solve(
+        counting_f, t_start=0.0, t_end=1.0, y_0=1.0, num_steps=4
+    )
+    # construction does not integrate
+    assert calls == []
+    assert np.isclose(test_solver.h, 0.25)
+    assert calls == []
+
+    solution = test_solver.solution
+    assert len(calls) > 0
+    n_calls = len(calls)
+    # solution is cached after the first access
+    assert test_solver.solution is solution
+    assert len(calls) == n_calls
+
+
+def test_as_ivp(solver1):
+    ivp = solver1.as_ivp()
+    assert ivp["t_span"] == (solver1.t_start, solver1.t_end)
+    assert ivp["y0"] == [solver1.y_0]
+    assert np.array_equal(ivp["t_eval"], solver1.mesh)
+    assert np.allclose(ivp["fun"](0.5, np.array([2.0])), [f(0.5, 2.0)])
+
+    integrate = pytest.importorskip("scipy.integrate")
+    sol = integrate.solve_ivp(**ivp, method="RK45", rtol=1e-8, atol=1e-10)
+    assert sol.success and sol.y.shape == (1, solver1.num_steps + 1)
+
+
+def test_rk4_jit_matches_loop():
+    numba = pytest.importorskip("numba")
+    jit_f = numba.njit(f)
+
+    # RK4 swaps in its own compiled kernels
+    rk4_solver = RK4_1D_Solve(
+        jit_f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=50
+    )
+    assert np.allclose(rk4_solver._solve_jit(), rk4_solver._solve_loop())
+    y0_vec = np.linspace(-1.0, 1.0, 5)
+    batch_jit = rk4_solver.solve_batch(y0_vec)
+    rk4_solver.f = f
+    assert np.allclose(batch_jit, rk4_solver.solve_batch(y0_vec))
+
+
+def test_rk4_solve():
+    # inherited docs do not describe the Euler scheme
+    for name in ("solve", "solve_batch", "_solve_jit", "_solve_batch_jit"):
+        assert "Euler" not in getattr(RK4_1D_Solve, name).__doc__
+
+    # one RK4 step of dy/dt = y is the 4th order Taylor polynomial of e^h
+    def simple_f(t, y):
+        return y
+
+    test_solver = RK4_1D_Solve(
+        simple_f, t_start=0.0, t_end=0.5, y_0=1.0, num_steps=1
+    )
+    h = 0.5
+    expected = 1 + h + h**2 / 2 + h**3 / 6 + h**4 / 24
+    assert np.isclose(test_solver.solution[-1], expected)
+
+    # 4th order convergence on dy/dt = -y + cos(t), y(0) = 1
+    exact = (np.cos(5.0) + np.sin(5.0) + np.exp(-5.0)) / 2
+    errors = [
+        abs(RK4_1D_Solve(f, 0.0, 5.0, 1.0, n).solution[-1] - exact)
+        for n in (20, 40)
+    ]
+    assert 12 < errors[0] / errors[1] < 20
+
+    # batch columns match single trajectories
+    y0_vec = np.array([0.0, 1.0, 2.0])
+    Y = RK4_1D_Solve(f, 0.0, 5.0, 1.0, 20).solve_batch(y0_vec)
+    for j, y_0 in enumerate(y0_vec):
+        single = RK4_1D_Solve(f, 0.0, 5.0, y_0, 20).solution
+        assert np.allclose(Y[:, j], single)
+
+
 ##########################################
 # exception handled test cases
 def test_invalid_f_callable_cases():
@@ -97,11 +328,22 @@ def test_invalid_t_start_t_end_cases():
     with pytest.raises(ValueError, match="t_start must be less than t_end."):
         Euler1D_Solve(f, t_start=5.0, t_end=0.0, y_0=1.0, num_steps=10)
     # t_start is a string
-    with pytest.raises(TypeError, match="t_start and t_end must be numbers."):
+    with pytest.raises(TypeError, match="t_start must be a real finite"):
         Euler1D_Solve(f, t_start="0.0", t_end=5.0, y_0=1.0, num_steps=10)
-    # t_start is a boolean
-    with pytest.raises(TypeError, match="t_start and t_end must be numbers."):
+    # t_end is a string
+    with pytest.raises(TypeError, match="t_end must be a real finite"):
         Euler1D_Solve(f, t_start=0.0, t_end="5.0", y_0=1.0, num_steps=10)
+    # t_start is a boolean
+    with pytest.raises(TypeError, match="t_start must be a real finite"):
+        Euler1D_Solve(f, t_start=False, t_end=5.0, y_0=1.0, num_steps=10)
+    # t_end is infinite
+    with pytest.raises(TypeError, match="t_end must be a real finite"):
+        Euler1D_Solve(f, t_start=0.0, t_end=np.inf, y_0=1.0, num_steps=10)
+    # numpy scalars are accepted
+    solver = Euler1D_Solve(
+        f, t_start=np.float32(0.0), t_end=np.int64(5), y_0=1.0, num_steps=10
+    )
+    assert isinstance(solver.t_end, float)
 
 
 def test_invalid_num_steps_cases():
@@ -117,6 +359,8 @@ def test_invalid_num_steps_cases():
     # num_steps is boolean
     with pytest.raises(ValueError, match="num_steps must be a pos integer."):
         Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=False)
+    with pytest.raises(ValueError, match="num_steps must be a pos integer."):
+        Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps=True)
     # num_steps is a string
     with pytest.raises(ValueError, match="num_steps must be a pos integer."):
         Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=1.0, num_steps="100")
@@ -124,8 +368,18 @@ def test_invalid_num_steps_cases():
 
 def test_invalid_y_0_cases():
     # y_0 is a string
-    with pytest.raises(TypeError, match="y_0 must be a real number."):
+    with pytest.raises(TypeError, match="y_0 must be a real finite number."):
         Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0="1.0", num_steps=10)
     # y_0 is a boolean
-    with pytest.raises(TypeError, match="y_0 must be a real number."):
+    with pytest.raises(TypeError, match="y_0 must be a real finite number."):
         Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=True, num_steps=10)
+    # y_0 is NaN
+    with pytest.raises(TypeError, match="y_0 must be a real finite number."):
+        Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=np.nan, num_steps=10)
+    # y_0 is finite but out of float range
+    with pytest.raises(TypeError, match="y_0 must be a real finite number."):
+        Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=10**400, num_steps=10)
+    big = np.longdouble(np.finfo(np.float64).max) * 16
+    if np.isfinite(big):
+        with pytest.raises(TypeError, match="y_0 must be a real finite"):
+            Euler1D_Solve(f, t_start=0.0, t_end=5.0, y_0=big, num_steps=10)